@@ -40,10 +40,25 @@ class NoteManager:
         self.notes_dir = ensure_notes_dir(notes_dir)
         self.template_manager = TemplateManager()
 
-        # Initialize version control
+        # Version control is set up lazily, on first use of version_manager
         self.version_control_enabled = enable_version_control
-        if self.version_control_enabled:
-            self.version_manager = VersionControlManager()
+        self._version_manager: Optional[VersionControlManager] = None
+
+    @property
+    def version_manager(self) -> VersionControlManager:
+        """
+        The version control manager, created on first access.
+
+        Constructing it creates the version history directory, so it is
+        deferred until a code path actually needs version control.
+        """
+        if self._version_manager is None:
+            self._version_manager = VersionControlManager()
+        return self._version_manager
+
+    @version_manager.setter
+    def version_manager(self, manager: VersionControlManager) -> None:
+        self._version_manager = manager
 
     # Copy your create_version method here - you'll add the rest of the class below
     def create_version(self, title: str, category: Optional[str] = None,
@@ -5,17 +5,30 @@ This module provides functions to encrypt and decrypt note content
 using strong encryption algorithms.
 """
 import os
-import base64
+import itertools
 import logging
 import getpass
 from typing import Tuple, Union, Optional, Dict, Any
 import json
 
-from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
-from cryptography.hazmat.primitives import hashes, hmac
 from cryptography.hazmat.primitives.ciphers.aead import AESGCM
 from cryptography.exceptions import InvalidTag
 
+# Prefer the optimized fastpbkdf2 implementation when it is installed;
+# both produce the same keys as any other PBKDF2-HMAC-SHA256
+try:
+    from fastpbkdf2 import pbkdf2_hmac
+except ImportError:
+    from hashlib import pbkdf2_hmac
+
+# Use the SIMD-accelerated pybase64 when it is installed. Its encoded
+# output is identical to the standard library's; decoding goes through
+# _b64decode so both backends accept exactly the same input
+try:
+    import pybase64 as _b64
+except ImportError:
+    import base64 as _b64  # type: ignore[no-redef]
+
 # Configure logging
 logger = logging.getLogger(__name__)
 
@@ -26,6 +39,7 @@ ITERATIONS = 100000  # Number of iterations for PBKDF2
 NONCE_SIZE = 12  # Size of nonce for AES-GCM
 TAG_SIZE = 16  # Size of authentication tag (part of ciphertext in AESGCM)
 MARKER = b'MARKNOTE_ENCRYPTED_V1'  # Marker to identify encrypted content
+MARKER_B64_LENGTH = -(-len(MARKER) // 3) * 4  # Base64 characters covering the marker
 
 class EncryptionError(Exception):
     """Exception raised for encryption-related errors."""
@@ -43,29 +57,46 @@ class PasswordError(DecryptionError):
     """Exception raised when password is incorrect or missing."""
     pass
 
-def derive_key(password: str, salt: bytes, iterations: int = ITERATIONS) -> bytes:
+def derive_key(password: str, salt: bytes, iterations: Optional[int] = None) -> bytes:
     """
     Derive a cryptographic key from a password using PBKDF2.
     
     Args:
         password: The password from which to derive the key
         salt: Random salt for key derivation
-        iterations: Number of iterations for PBKDF2
+        iterations: Number of iterations for PBKDF2, defaulting to the
+            current value of ITERATIONS
         
     Returns:
         Derived key as bytes
     """
-    kdf = PBKDF2HMAC(
-        algorithm=hashes.SHA256(),
-        length=KEY_LENGTH,
-        salt=salt,
-        iterations=iterations,
-    )
-    return kdf.derive(password.encode('utf-8'))
+    if iterations is None:
+        iterations = ITERATIONS
+    key: bytes = pbkdf2_hmac('sha256', password.encode('utf-8'), salt, iterations, KEY_LENGTH)
+    return key
 
-def encrypt_content(content: str, password: str, metadata: Optional[Dict[str, Any]] = None) -> str:
+def _b64decode(data: str) -> bytes:
     """
-    Encrypt note content with a password.
+    Decode base64 text, ignoring whitespace such as line wrapping.
+    
+    Decoding is strict: without validation the standard library silently
+    drops invalid characters and data after padding, while pybase64
+    rejects some of that input, so results would depend on the backend.
+    
+    Args:
+        data: The base64 text to decode
+        
+    Returns:
+        The decoded bytes
+        
+    Raises:
+        ValueError: If data is not valid base64
+    """
+    return _b64.b64decode("".join(data.split()), validate=True)
+
+def encrypt_bytes(content: str, password: str, metadata: Optional[Dict[str, Any]] = None) -> bytes:
+    """
+    Encrypt note content with a password, returning the raw encrypted bytes.
     
     Args:
         content: The note content to encrypt
@@ -73,7 +104,7 @@ def encrypt_content(content: str, password: str, metadata: Optional[Dict[str, An
         metadata: Optional metadata to include in encrypted file
     
     Returns:
-        Base64-encoded encrypted content
+        Encrypted data as MARKER + salt + nonce + ciphertext
         
     Raises:
         EncryptionError: If encryption fails
@@ -102,21 +133,36 @@ def encrypt_content(content: str, password: str, metadata: Optional[Dict[str, An
         ciphertext = cipher.encrypt(nonce, plaintext, MARKER)
         
         # Format the output: MARKER + salt + nonce + ciphertext
-        encrypted_data = MARKER + salt + nonce + ciphertext
-        
-        # Base64 encode for storage
-        return base64.b64encode(encrypted_data).decode('utf-8')
+        return MARKER + salt + nonce + ciphertext
     
     except Exception as e:
         logger.error(f"Encryption failed: {str(e)}")
         raise EncryptionError(f"Failed to encrypt content: {str(e)}") from e
 
-def decrypt_content(encrypted_content: str, password: str) -> Tuple[str, Optional[Dict[str, Any]]]:
+def encrypt_content(content: str, password: str, metadata: Optional[Dict[str, Any]] = None) -> str:
     """
-    Decrypt encrypted note content.
+    Encrypt note content with a password.
     
     Args:
-        encrypted_content: The encrypted content as a base64 string
+        content: The note content to encrypt
+        password: Password for encryption
+        metadata: Optional metadata to include in encrypted file
+    
+    Returns:
+        Base64-encoded encrypted content
+        
+    Raises:
+        EncryptionError: If encryption fails
+    """
+    # Base64 encode for storage in text note files
+    return _b64.b64encode(encrypt_bytes(content, password, metadata)).decode('utf-8')
+
+def decrypt_bytes(raw_data: bytes, password: str) -> Tuple[str, Optional[Dict[str, Any]]]:
+    """
+    Decrypt raw encrypted bytes as produced by encrypt_bytes.
+    
+    Args:
+        raw_data: The encrypted data (MARKER + salt + nonce + ciphertext)
         password: Password for decryption
     
     Returns:
@@ -128,9 +174,6 @@ def decrypt_content(encrypted_content: str, password: str) -> Tuple[str, Optiona
         PasswordError: If the provided password is incorrect
     """
     try:
-        # Decode from base64
-        raw_data = base64.b64decode(encrypted_content)
-        
         # Check format marker
         if not raw_data.startswith(MARKER):
             raise DecryptionError("Invalid encrypted data format")
@@ -171,19 +214,54 @@ def decrypt_content(encrypted_content: str, password: str) -> Tuple[str, Optiona
         logger.error(f"Decryption failed: {str(e)}")
         raise DecryptionError(f"Failed to decrypt content: {str(e)}") from e
 
+def decrypt_content(encrypted_content: str, password: str) -> Tuple[str, Optional[Dict[str, Any]]]:
+    """
+    Decrypt encrypted note content.
+    
+    Args:
+        encrypted_content: The encrypted content as a base64 string
+        password: Password for decryption
+    
+    Returns:
+        Tuple of (decrypted content, metadata)
+        
+    Raises:
+        DecryptionError: If decryption fails
+        AuthenticationError: If the authentication tag is invalid
+        PasswordError: If the provided password is incorrect
+    """
+    try:
+        # Decode from base64
+        raw_data = _b64decode(encrypted_content)
+    except Exception as e:
+        logger.error(f"Decryption failed: {str(e)}")
+        raise DecryptionError(f"Failed to decrypt content: {str(e)}") from e
+    
+    return decrypt_bytes(raw_data, password)
+
 def is_encrypted(content: str) -> bool:
     """
     Check if the content is encrypted.
     
+    Only the leading base64 characters that encode MARKER are checked, with
+    whitespace skipped; a corrupted remainder is reported when the content
+    is decrypted.
+    
     Args:
         content: The content to check
         
     Returns:
         True if the content appears to be encrypted, False otherwise
     """
+    if not isinstance(content, str) or not content:
+        return False
+    
     try:
-        # Try to decode as base64
-        decoded = base64.b64decode(content)
+        # Only decode the base64 characters that encode the marker, skipping
+        # whitespace such as line wrapping
+        prefix = "".join(itertools.islice(
+            (char for char in content if not char.isspace()), MARKER_B64_LENGTH))
+        decoded = _b64decode(prefix)
         
         # Check for the marker
         return decoded.startswith(MARKER)
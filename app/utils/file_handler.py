@@ -6,6 +6,10 @@ import sys
 import yaml
 from typing import Dict, Any, Tuple, Optional, List, Set
 
+# Use libyaml's C loader and emitter for frontmatter when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_YAML_DUMPER = getattr(yaml, "CDumper", yaml.Dumper)
+
 def get_default_notes_dir() -> str:
     """
     Get the default directory for storing notes.
@@ -97,7 +101,7 @@ def parse_frontmatter(content: str) -> Tuple[Dict[str, Any], str]:
             frontmatter = content[3:end_index].strip()
             # Parse the YAML frontmatter
             try:
-                metadata = yaml.safe_load(frontmatter) or {}
+                metadata = yaml.load(frontmatter, Loader=_YAML_LOADER) or {}
                 
                 # Convert linked_notes to set if present
                 if 'linked_notes' in metadata and isinstance(metadata['linked_notes'], list):
@@ -130,7 +134,7 @@ def add_frontmatter(content: str, metadata: Dict[str, Any]) -> str:
         metadata_copy['linked_notes'] = list(metadata_copy['linked_notes'])
     
     # Convert metadata to YAML
-    frontmatter = yaml.dump(metadata_copy, default_flow_style=False)
+    frontmatter = yaml.dump(metadata_copy, Dumper=_YAML_DUMPER, default_flow_style=False)
     
     # Add frontmatter to content
     return f"---\n{frontmatter}---\n\n{clean_content}"
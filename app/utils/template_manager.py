@@ -2,10 +2,64 @@
 Template management utilities for MarkNote.
 """
 import os
+import functools
 import jinja2
 from datetime import datetime
 from typing import Dict, Any, List, Optional
 
+
+@functools.lru_cache(maxsize=16)
+def _get_environment(templates_dir: str) -> jinja2.Environment:
+    """
+    Get the Jinja environment for a templates directory.
+
+    Environments are shared between TemplateManager instances so compiled
+    templates are reused. Jinja still checks each template's modification
+    time before using its cached copy, so edited templates are reloaded.
+
+    Args:
+        templates_dir: Directory containing the templates.
+
+    Returns:
+        The Jinja environment for the directory.
+    """
+    return jinja2.Environment(
+        loader=jinja2.FileSystemLoader(templates_dir),
+        autoescape=False,  # No need to escape in markdown
+        trim_blocks=True,
+        lstrip_blocks=True
+    )
+
+
+def _atomic_write(path: str, content: str) -> None:
+    """
+    Write content to a file atomically.
+
+    The encoded content is written straight to a temporary file in the same
+    directory, bypassing buffered text I/O, and then moved over the target so
+    readers never see a partially written template.
+
+    Args:
+        path: Path of the file to write.
+        content: Text to write, encoded as UTF-8.
+    """
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    data = memoryview(content.encode("utf-8"))
+    # 0o666 lets the process umask decide permissions, as open() would
+    fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+    try:
+        try:
+            while data:
+                data = data[os.write(fd, data):]
+        finally:
+            os.close(fd)
+        os.replace(temp_path, path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+
 class TemplateManager:
     """
     Manages templates for note creation.
@@ -16,12 +70,7 @@ class TemplateManager:
             templates_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), "templates")
         
         self.templates_dir = templates_dir
-        self.env = jinja2.Environment(
-            loader=jinja2.FileSystemLoader(templates_dir),
-            autoescape=False,  # No need to escape in markdown
-            trim_blocks=True,
-            lstrip_blocks=True
-        )
+        self.env = _get_environment(templates_dir)
     
     def list_templates(self) -> List[str]:
         """
@@ -153,8 +202,7 @@ class TemplateManager:
                 """
         
         # Write template to file
-        with open(template_path, 'w') as f:
-            f.write(template_content)
+        _atomic_write(template_path, template_content)
             
         return template_path
         
@@ -178,8 +226,7 @@ class TemplateManager:
         if not os.path.exists(template_dir):
             raise FileNotFoundError(f"Template '{template_name}' not found")
             
-        with open(template_path, 'w') as f:
-            f.write(content)
+        _atomic_write(template_path, content)
             
         return template_path
         
@@ -15,9 +15,15 @@ setup(
     include_package_data=True,
     install_requires=install_requires,
     extras_require={
+        "fast": [
+            "fastpbkdf2>=0.2",
+            "pybase64>=1.3",
+        ],
         "dev": [
             "pytest>=7.4.3",
             "pytest-cov>=4.1.0",
+            "pytest-xdist>=3.5.0",
+            "pyfakefs>=5.3.0",
             "black>=23.12.1",
             "flake8>=6.1.0",
             "mypy>=1.7.1",
@@ -17,7 +17,7 @@ from app.core.daily_note_service import DailyNoteService
 class TestDailyCommandsFunctionality:
     """Test case for testing the daily note CLI commands."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def runner(self):
         """Provide a Click CLI test runner."""
         return CliRunner()
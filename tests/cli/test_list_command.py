@@ -17,7 +17,7 @@ from datetime import datetime, timedelta
 class TestListCommandFunctionality:
     """Test case for the 'list' command functionality."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def runner(self):
         """Provide a Click CLI test runner."""
         return CliRunner()
@@ -14,7 +14,7 @@ from datetime import datetime, timedelta
 class TestListSortByCreatedFunctionality:
     """Test case for the 'list' command with sort by creation date functionality."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def runner(self):
         """Provide a Click CLI test runner."""
         return CliRunner()
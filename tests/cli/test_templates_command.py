@@ -15,7 +15,7 @@ from app.cli.commands import cli
 class TestTemplatesCommandFunctionality:
     """Test case for the 'templates' command functionality."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def runner(self):
         """Provide a Click CLI test runner."""
         return CliRunner()
@@ -9,11 +9,13 @@ from unittest.mock import patch, MagicMock, call
 from click.testing import CliRunner
 from app.cli.commands import cli
 
+pytestmark = pytest.mark.unit
+
 
 class TestVersionsDiffCommand:
     """Tests for the 'marknote versions diff' command."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def runner(self):
         """Click CLI test runner."""
         return CliRunner()
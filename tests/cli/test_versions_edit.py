@@ -9,11 +9,13 @@ from unittest.mock import patch, MagicMock, call, mock_open
 from click.testing import CliRunner
 from app.cli.commands import cli
 
+pytestmark = pytest.mark.unit
+
 
 class TestVersionsEditCommand:
     """Tests for the 'marknote versions edit' command."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def runner(self):
         """Click CLI test runner."""
         return CliRunner()
@@ -0,0 +1,26 @@
+"""
+Shared pytest configuration for the MarkNote test suite.
+
+On Linux, temporary files are created on the memory-backed /dev/shm unless
+TMPDIR is already set. Set MARKNOTE_TEST_TMPFS=0 to opt out, for example when
+/dev/shm is too small.
+"""
+import os
+import sys
+import tempfile
+
+_SHM_DIR = "/dev/shm"
+
+
+def pytest_configure(config):
+    """Point TMPDIR at tmpfs before any test creates temporary files."""
+    use_tmpfs = (
+        sys.platform == "linux"
+        and os.environ.get("MARKNOTE_TEST_TMPFS", "1") != "0"
+        and os.path.isdir(_SHM_DIR)
+        and os.access(_SHM_DIR, os.W_OK)
+    )
+    if use_tmpfs and "TMPDIR" not in os.environ:
+        os.environ["TMPDIR"] = _SHM_DIR
+        # Drop the cached default so tempfile picks up the new TMPDIR
+        tempfile.tempdir = None
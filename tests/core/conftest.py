@@ -0,0 +1,43 @@
+"""
+Shared pytest configuration for the core tests.
+"""
+import pytest
+
+_DEFAULT_TEMPLATE = b"""---
+title: {{ title }}
+created_at: {{ created_at }}
+updated_at: {{ updated_at }}
+type: default
+---
+
+# {{ title }}
+
+## Default Template Content
+
+This is a default template for testing.
+"""
+
+_MEETING_TEMPLATE = b"""---
+title: {{ title }}
+created_at: {{ created_at }}
+updated_at: {{ updated_at }}
+type: meeting
+---
+
+# {{ title }}
+
+## Meeting Notes
+
+Meeting details go here.
+"""
+
+
+@pytest.fixture(scope="session")
+def golden_templates_dir(tmp_path_factory):
+    """Build the built-in test templates once; tests must not modify them."""
+    golden_dir = tmp_path_factory.mktemp("golden_templates")
+    for name, content in (("default", _DEFAULT_TEMPLATE), ("meeting", _MEETING_TEMPLATE)):
+        template_dir = golden_dir / name
+        template_dir.mkdir()
+        (template_dir / "template.md").write_bytes(content)
+    return str(golden_dir)
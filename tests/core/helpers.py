@@ -0,0 +1,10 @@
+"""
+Shared assertion helpers for the core tests.
+"""
+import os
+import stat
+
+
+def assert_regular_file(path):
+    """Assert that path is an existing regular file, using a single stat() call."""
+    assert stat.S_ISREG(os.stat(path).st_mode), f"{path} is not a regular file"
@@ -4,13 +4,34 @@ Tests for the bulk tag rename functionality in NoteManager.
 import os
 import shutil
 import tempfile
-from unittest import TestCase, mock
+from unittest import TestCase
 from datetime import datetime
+from pathlib import Path
 from typing import List, Optional, Dict, Any
 
 from app.core.note_manager import NoteManager
 from app.models.note import Note
-from app.utils.file_handler import write_note_file, read_note_file
+from app.utils.file_handler import read_note_file
+
+
+# Pre-rendered note file; tags are given as a YAML flow sequence
+_NOTE_TEMPLATE = """---
+title: {title}
+created_at: '{created_at}'
+updated_at: '{updated_at}'
+tags: [{tags}]
+{category_line}---
+
+{content}"""
+
+
+def _write_bytes(path: str, data: bytes) -> None:
+    """Write data to path with a single open/write/close."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, data)
+    finally:
+        os.close(fd)
 
 
 class TestBulkRenameTags(TestCase):
@@ -23,6 +44,9 @@ class TestBulkRenameTags(TestCase):
         
         # Create a NoteManager with the test directory
         self.note_manager = NoteManager(notes_dir=self.test_dir, enable_version_control=False)
+
+        # Category directories already created, so each is made only once
+        self._category_dirs = set()
         
         # Create some test notes
         self.test_notes = [
@@ -33,9 +57,15 @@ class TestBulkRenameTags(TestCase):
             {"title": "Test Note 5", "tags": ["development", "python", "meeting"]},
         ]
         
-        # Add notes to the test directory
+        # Add notes to the test directory, keeping the bytes written to each
+        self._paths = {}
+        self._written = {}
         for note_data in self.test_notes:
-            self._create_test_note(note_data["title"], note_data["tags"])
+            self._paths[note_data["title"]] = self._create_test_note(
+                note_data["title"], note_data["tags"])
+
+        # Snapshot modification times so tests can cheaply check for rewrites
+        self._initial_mtimes = self._stat_mtimes()
 
     def tearDown(self):
         """Clean up after each test."""
@@ -45,22 +75,21 @@ class TestBulkRenameTags(TestCase):
     def _create_test_note(self, title: str, tags: List[str], 
                          category: Optional[str] = None, content: str = "Test content") -> str:
         """Create a test note file in the test directory."""
-        if category:
+        if category and category not in self._category_dirs:
             # Ensure category directory exists
-            category_dir = os.path.join(self.test_dir, category)
-            os.makedirs(category_dir, exist_ok=True)
-        
-        # Create note metadata
-        metadata = {
-            "title": title,
-            "created_at": datetime.now().isoformat(),
-            "updated_at": datetime.now().isoformat(),
-            "tags": tags,
-        }
-        
-        if category:
-            metadata["category"] = category
-            
+            os.makedirs(os.path.join(self.test_dir, category), exist_ok=True)
+            self._category_dirs.add(category)
+
+        now = datetime.now().isoformat()
+        data = _NOTE_TEMPLATE.format(
+            title=title,
+            created_at=now,
+            updated_at=now,
+            tags=", ".join(tags),
+            category_line=f"category: {category}\n" if category else "",
+            content=content,
+        ).encode("utf-8")
+
         # Generate note filename
         filename = title.lower().replace(" ", "-") + ".md"
         
@@ -68,10 +97,15 @@ class TestBulkRenameTags(TestCase):
         file_path = os.path.join(self.test_dir, category or "", filename)
         
         # Write the note file
-        write_note_file(file_path, metadata, content)
+        _write_bytes(file_path, data)
+        self._written[file_path] = data
         
         return file_path
 
+    def _stat_mtimes(self) -> Dict[str, int]:
+        """Return the modification time of each note created in setUp."""
+        return {path: os.stat(path).st_mtime_ns for path in self._paths.values()}
+
     def _read_note_tags(self, title: str, category: Optional[str] = None) -> List[str]:
         """Read the tags from a note file."""
         # Generate note filename
@@ -98,16 +132,16 @@ class TestBulkRenameTags(TestCase):
         
         # Verify each affected note's tags were updated
         for title in ["Test Note 1", "Test Note 4", "Test Note 5"]:
-            tags = self._read_note_tags(title)
+            tags = set(self._read_note_tags(title))
             self.assertIn(new_tag, tags)
             self.assertNotIn(old_tag, tags)
             self.assertTrue(results[title].startswith("✓"))
             
         # Verify unaffected notes weren't changed
         for title in ["Test Note 2", "Test Note 3"]:
-            tags = self._read_note_tags(title)
+            tags = set(self._read_note_tags(title))
             self.assertNotIn(new_tag, tags)
-            self.assertEqual(title not in results, True)
+            self.assertNotIn(title, results)
 
     def test_rename_tag_with_filter_tags_OR_logic(self):
         """Test renaming tags only in notes that have specific filter tags (OR logic)."""
@@ -132,7 +166,7 @@ class TestBulkRenameTags(TestCase):
             tags = self._read_note_tags(title)
             self.assertIn(old_tag, tags)
             self.assertNotIn(new_tag, tags)
-            self.assertEqual(title not in results, True)
+            self.assertNotIn(title, results)
 
     def test_rename_tag_with_filter_tags_AND_logic(self):
         """Test renaming tags only in notes that have ALL specified filter tags (AND logic)."""
@@ -159,7 +193,7 @@ class TestBulkRenameTags(TestCase):
             tags = self._read_note_tags(title)
             self.assertIn(old_tag, tags)
             self.assertNotIn(new_tag, tags)
-            self.assertEqual(title not in results, True)
+            self.assertNotIn(title, results)
 
     def test_rename_nonexistent_tag(self):
         """Test renaming a tag that doesn't exist in any notes."""
@@ -172,10 +206,11 @@ class TestBulkRenameTags(TestCase):
         # Check results
         self.assertEqual(len(results), 0)  # No notes should be affected
         
-        # Verify no notes were changed
-        for note_data in self.test_notes:
-            tags = self._read_note_tags(note_data["title"])
-            self.assertEqual(set(tags), set(note_data["tags"]))
+        # Verify no notes were rewritten; the content check also catches a
+        # rewrite within the filesystem's timestamp granularity
+        self.assertEqual(self._stat_mtimes(), self._initial_mtimes)
+        for path in self._paths.values():
+            self.assertEqual(Path(path).read_bytes(), self._written[path])
 
     def test_rename_tag_with_category_filter(self):
         """Test renaming tags only in notes of a specific category."""
@@ -210,9 +245,19 @@ class TestBulkRenameTags(TestCase):
         # Create a NoteManager with version control enabled
         note_manager_with_versioning = NoteManager(notes_dir=self.test_dir, enable_version_control=True)
         
-        # Mock the version_manager to check if version is created
-        note_manager_with_versioning.version_manager.save_version = mock.MagicMock(return_value="v1_test")
-        note_manager_with_versioning.version_manager.generate_note_id = mock.MagicMock(return_value="note_id")
+        # Stub the version_manager, counting calls to check versions are created
+        calls = {"save": 0, "generate_id": 0}
+
+        def save_version(*args, **kwargs):
+            calls["save"] += 1
+            return "v1_test"
+
+        def generate_note_id(*args, **kwargs):
+            calls["generate_id"] += 1
+            return "note_id"
+
+        note_manager_with_versioning.version_manager.save_version = save_version
+        note_manager_with_versioning.version_manager.generate_note_id = generate_note_id
         
         old_tag = "python"
         new_tag = "python3"
@@ -221,7 +266,8 @@ class TestBulkRenameTags(TestCase):
         results = note_manager_with_versioning.bulk_rename_tag(old_tag, new_tag)
         
         # Check that version_manager.save_version was called for each affected note
-        self.assertEqual(note_manager_with_versioning.version_manager.save_version.call_count, 3)
+        self.assertEqual(calls["save"], 3)
+        self.assertEqual(calls["generate_id"], 3)
         
         # Verify each affected note's tags were updated
         for title in ["Test Note 1", "Test Note 4", "Test Note 5"]:
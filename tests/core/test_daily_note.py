@@ -116,8 +116,8 @@ class TestDailyNoteFunctionality:
         assert success, f"Failed to create daily note: {message}"
         
         # Verify all tags are present
-        for tag in tags:
-            assert tag in note.tags, f"Tag {tag} should be in note tags"
+        missing = set(tags) - set(note.tags)
+        assert not missing, f"Missing tags: {missing}"
     
     def test_find_daily_note(self, note_manager):
         """Test finding a daily note after creation."""
@@ -1,85 +1,80 @@
 import os
-import shutil
-import tempfile
-import unittest
-from datetime import datetime
 from pathlib import Path
 
-from app.core.note_manager import NoteManager
-from app.utils.file_handler import parse_frontmatter
-
-
-class TestFileCreation(unittest.TestCase):
-    """Test file creation functionality for the NoteManager."""
-    
-    def setUp(self):
-        """Set up a temporary directory for the test notes."""
-        # Create a temporary directory for test notes
-        self.temp_dir = tempfile.mkdtemp()
-        self.note_manager = NoteManager(notes_dir=self.temp_dir)
-    
-    def tearDown(self):
-        """Clean up the temporary directory after tests."""
-        # Remove the temporary directory and its contents
-        shutil.rmtree(self.temp_dir)
-    
-    def test_create_note_with_title_only(self):
-        """Test creating a note with just a title."""
-        # Create a note with just a title
-        title = "Test Note Title"
-        note = self.note_manager.create_note(title=title)
-        
-        # Check that the note object has the correct title
-        self.assertEqual(note.title, title)
-        
-        # Get the expected file path
-        expected_filename = "test-note-title.md"
-        expected_path = os.path.join(self.temp_dir, expected_filename)
-        
-        # Check that the file exists
-        self.assertTrue(os.path.exists(expected_path))
-        
-        # Check that the file path in note metadata matches the actual path
-        self.assertEqual(note.metadata['path'], expected_path)
-        
-        # Read the file content and check frontmatter
-        with open(expected_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        # Parse the frontmatter
-        frontmatter, content_without_frontmatter = parse_frontmatter(content)
-        
-        # Check frontmatter contains correct title
-        self.assertEqual(frontmatter.get('title'), title)
-        
-        # Check content includes the title as a header
-        self.assertIn(f"# {title}", content_without_frontmatter)
-    
-    def test_create_duplicate_note(self):
-        """Test that creating a duplicate note raises an exception."""
-        # Create the first note
-        title = "Duplicate Test"
-        self.note_manager.create_note(title=title)
-        
-        # Try to create a second note with the same title
-        with self.assertRaises(FileExistsError):
-            self.note_manager.create_note(title=title)
-    
-    def test_file_path_matches_metadata(self):
-        """Test that the file path in metadata matches the actual file path."""
-        # Create a note
-        title = "Path Test"
-        note = self.note_manager.create_note(title=title)
-        
-        # Get the expected file path
-        expected_path = os.path.join(self.temp_dir, "path-test.md")
-        
-        # Check that the file path in metadata matches the expected path
-        self.assertEqual(note.metadata['path'], expected_path)
-        
-        # Verify that the file exists at this path
-        self.assertTrue(os.path.isfile(expected_path))
-
-
-if __name__ == '__main__':
-    unittest.main()
\ No newline at end of file
+import pytest
+
+from tests.core.helpers import assert_regular_file
+
+
+@pytest.fixture(scope="module")
+def notes_dir(tmp_path_factory):
+    """Create one temporary notes directory shared by this module's tests."""
+    return str(tmp_path_factory.mktemp("notes"))
+
+
+@pytest.fixture(scope="module")
+def note_manager(notes_dir):
+    """
+    Create a NoteManager shared by this module's tests.
+
+    Every test uses a distinct note title, so the tests never see each
+    other's files.
+    """
+    # Imported here so collecting this module does not load NoteManager's dependencies
+    from app.core.note_manager import NoteManager
+
+    return NoteManager(notes_dir=notes_dir)
+
+
+def test_create_note_with_title_only(note_manager, notes_dir):
+    """Test creating a note with just a title."""
+    # Create a note with just a title
+    title = "Test Note Title"
+    note = note_manager.create_note(title=title)
+
+    # Check that the note object has the correct title
+    assert note.title == title
+
+    # Get the expected file path
+    expected_filename = "test-note-title.md"
+    expected_path = os.path.join(notes_dir, expected_filename)
+
+    # Check that the file exists
+    assert_regular_file(expected_path)
+
+    # Check that the file path in note metadata matches the actual path
+    assert note.metadata['path'] == expected_path
+
+    # Read the raw file content; the checked substrings are all ASCII
+    content = Path(expected_path).read_bytes()
+    assert content.startswith(b"---\n")
+
+    # Split off the frontmatter block
+    frontmatter, _, content_without_frontmatter = content[3:].partition(b"\n---\n")
+
+    # Check frontmatter contains correct title
+    assert f"\ntitle: {title}\n".encode() in frontmatter
+
+    # Check content includes the title as a header
+    assert f"# {title}".encode() in content_without_frontmatter
+
+
+@pytest.mark.parametrize("title,expected_filename", [
+    ("Duplicate Test", "duplicate-test.md"),
+    ("Path Test", "path-test.md"),
+])
+def test_create_note_basics(note_manager, notes_dir, title, expected_filename):
+    """Test the created file's path and that creating a duplicate note fails."""
+    # Create a note
+    note = note_manager.create_note(title=title)
+
+    # Check that the file path in metadata matches the expected path
+    expected_path = os.path.join(notes_dir, expected_filename)
+    assert note.metadata['path'] == expected_path
+
+    # Verify that the file exists at this path
+    assert_regular_file(expected_path)
+
+    # Try to create a second note with the same title
+    with pytest.raises(FileExistsError):
+        note_manager.create_note(title=title)
@@ -1,111 +1,94 @@
 """
 Tests for the template management functionality in TemplateManager.
 """
+import builtins
 import os
-import shutil
-import tempfile
-from unittest import TestCase, mock
-from typing import List, Dict, Any, Optional
 
+import pytest
+
+from app.utils import template_manager as template_manager_module
 from app.utils.template_manager import TemplateManager
+from tests.core.helpers import assert_regular_file
 
+TEMPLATES_DIR = "/templates"
 
-class TestTemplateManager(TestCase):
-    """Test cases for the TemplateManager class."""
-
-    def setUp(self):
-        """Set up test environment before each test."""
-        # Create a temporary directory for tests
-        self.test_dir = tempfile.mkdtemp()
-        
-        # Create template directories with sample templates
-        self.setup_test_templates()
-        
-        # Create a TemplateManager with the test directory
-        self.template_manager = TemplateManager(templates_dir=self.test_dir)
-
-    def tearDown(self):
-        """Clean up after each test."""
-        # Remove the temporary directory
-        shutil.rmtree(self.test_dir)
-
-    def setup_test_templates(self):
-        """Set up test templates in the test directory."""
-        # Create default template directory
-        default_dir = os.path.join(self.test_dir, "default")
-        os.makedirs(default_dir)
-        
-        # Create default template file
-        with open(os.path.join(default_dir, "template.md"), "w") as f:
-            f.write("""---
-title: {{ title }}
-created_at: {{ created_at }}
-updated_at: {{ updated_at }}
-type: default
----
 
-# {{ title }}
+@pytest.fixture
+def template_manager(fs, golden_templates_dir):
+    """Create a TemplateManager over the golden templates on a fake filesystem."""
+    # Overlay the golden templates; files are read from disk lazily and
+    # any writes stay in the fake filesystem, leaving the originals intact
+    fs.add_real_directory(golden_templates_dir, read_only=False, target_path=TEMPLATES_DIR)
+    return TemplateManager(templates_dir=TEMPLATES_DIR)
 
-## Default Template Content
 
-This is a default template for testing.
-""")
-        
-        # Create another built-in template
-        meeting_dir = os.path.join(self.test_dir, "meeting")
-        os.makedirs(meeting_dir)
-        with open(os.path.join(meeting_dir, "template.md"), "w") as f:
-            f.write("""---
-title: {{ title }}
-created_at: {{ created_at }}
-updated_at: {{ updated_at }}
-type: meeting
----
+@pytest.fixture
+def open_calls(monkeypatch):
+    """Record the path of every file TemplateManager opens with open()."""
+    calls = []
+
+    def counting_open(file, *args, **kwargs):
+        calls.append(file)
+        # Looked up at call time so the fake filesystem's open() is used
+        return builtins.open(file, *args, **kwargs)
+
+    # Shadow the builtin in the module itself; pyfakefs re-patches
+    # builtins.open when each test starts running
+    monkeypatch.setattr(template_manager_module, "open", counting_open, raising=False)
+    return calls
+
+
+@pytest.fixture
+def replace_calls(template_manager, monkeypatch):
+    """Record the (source, destination) of every os.replace() TemplateManager makes."""
+    calls = []
+    # Resolved after template_manager so this wraps the fake filesystem's os
+    real_replace = template_manager_module.os.replace
+
+    def counting_replace(src, dst):
+        calls.append((src, dst))
+        return real_replace(src, dst)
+
+    monkeypatch.setattr(template_manager_module.os, "replace", counting_replace)
+    return calls
+
+
+def test_list_templates(template_manager):
+    """Test listing available templates."""
+    templates = template_manager.list_templates()
+
+    # Should find exactly the templates we created
+    assert sorted(templates) == ["default", "meeting"]
 
-# {{ title }}
 
-## Meeting Notes
-
-Meeting details go here.
-""")
-
-    def test_list_templates(self):
-        """Test listing available templates."""
-        templates = self.template_manager.list_templates()
-        
-        # Should find the templates we created
-        self.assertIn("default", templates)
-        self.assertIn("meeting", templates)
-        self.assertEqual(len(templates), 2)
-
-    def test_create_template_basic(self):
-        """Test creating a new template with default content."""
-        template_name = "test_template"
-        
-        # Create a new template
-        template_path = self.template_manager.create_template(template_name)
-        
-        # Check that the template file was created
-        self.assertTrue(os.path.exists(template_path))
-        self.assertEqual(os.path.basename(template_path), "template.md")
-        self.assertEqual(os.path.dirname(template_path), os.path.join(self.test_dir, template_name))
-        
-        # Check the template content
-        with open(template_path, "r") as f:
-            content = f.read()
-            
-        # Verify the content contains the template name
-        self.assertIn(f"type: {template_name}", content)
-        self.assertIn("# {{ title }}", content)
-        
-        # Verify the template is now in the list
-        templates = self.template_manager.list_templates()
-        self.assertIn(template_name, templates)
-
-    def test_create_template_with_content(self):
-        """Test creating a template with custom content."""
-        template_name = "custom_content"
-        custom_content = """---
+def test_create_template_basic(template_manager):
+    """Test creating a new template with default content."""
+    template_name = "test_template"
+
+    # Create a new template
+    template_path = template_manager.create_template(template_name)
+
+    # Check that the template file was created where expected
+    assert template_path == os.path.join(TEMPLATES_DIR, template_name, "template.md")
+    assert_regular_file(template_path)
+
+    # Check the template content
+    with open(template_path, "r") as f:
+        content = f.read()
+
+    # Verify the content contains the template name
+    assert f"type: {template_name}" in content
+    assert "# {{ title }}" in content
+
+    # Verify the template is now in the list
+    templates = template_manager.list_templates()
+    assert template_name in templates
+
+
+def test_create_template_with_content(template_manager):
+    """Test creating a template with custom content."""
+    template_name = "custom_content"
+    custom_content = """---
 title: {{ title }}
 created_at: {{ created_at }}
 type: custom_content
@@ -117,66 +100,103 @@ type: custom_content
 
 This is custom template content.
 """
-        
-        # Create a template with custom content
-        template_path = self.template_manager.create_template(template_name, content=custom_content)
-        
-        # Check that the template was created
-        self.assertTrue(os.path.exists(template_path))
-        
-        # Check the content
-        with open(template_path, "r") as f:
-            content = f.read()
-            
-        self.assertEqual(content, custom_content)
-
-    def test_create_template_based_on_existing(self):
-        """Test creating a template based on an existing template."""
-        template_name = "meeting_clone"
-        base_template = "meeting"
-        
-        # Create a template based on an existing one
-        template_path = self.template_manager.create_template(template_name, base_template=base_template)
-        
-        # Check that the template was created
-        self.assertTrue(os.path.exists(template_path))
-        
-        # Check the content
-        with open(template_path, "r") as f:
-            content = f.read()
-            
-        # Should be based on meeting template but with updated type
-        self.assertIn("## Meeting Notes", content)
-        self.assertIn(f"type: {template_name}", content)
-        self.assertNotIn("type: meeting", content)
-
-    def test_create_template_with_invalid_name(self):
-        """Test creating a template with an invalid name."""
-        # Test with invalid names
-        invalid_names = ["", "test with spaces", "test/with/slashes", "test!@#$"]
-        
-        for name in invalid_names:
-            with self.assertRaises(ValueError):
-                self.template_manager.create_template(name)
-
-    def test_create_template_already_exists(self):
-        """Test creating a template that already exists."""
-        # Create a template
-        template_name = "already_exists"
-        self.template_manager.create_template(template_name)
-        
-        # Try to create it again
-        with self.assertRaises(FileExistsError):
-            self.template_manager.create_template(template_name)
-
-    def test_update_template(self):
-        """Test updating an existing template."""
-        # Create a template first
-        template_name = "update_test"
-        self.template_manager.create_template(template_name)
-        
-        # New content to update with
-        new_content = """---
+
+    # Create a template with custom content
+    template_path = template_manager.create_template(template_name, content=custom_content)
+
+    # Check that the template was created
+    assert_regular_file(template_path)
+
+    # Check the content
+    with open(template_path, "r") as f:
+        content = f.read()
+
+    assert content == custom_content
+
+
+def test_create_template_based_on_existing(template_manager):
+    """Test creating a template based on an existing template."""
+    template_name = "meeting_clone"
+    base_template = "meeting"
+
+    # Create a template based on an existing one
+    template_path = template_manager.create_template(template_name, base_template=base_template)
+
+    # Check that the template was created
+    assert_regular_file(template_path)
+
+    # Check the content
+    with open(template_path, "r") as f:
+        content = f.read()
+
+    # Should be based on meeting template but with updated type
+    assert "## Meeting Notes" in content
+    assert f"type: {template_name}" in content
+    assert "type: meeting" not in content
+
+
+def test_template_writes_are_atomic(template_manager, open_calls, replace_calls):
+    """Test that template writes go through a temporary file that replaces the target."""
+    template_path = template_manager.create_template("atomic_test")
+    new_content = "# {{ title }}\n"
+    template_manager.update_template("atomic_test", new_content)
+
+    # Content is written with os.open on a temporary file, never opened in place
+    assert open_calls == []
+    assert [dst for _, dst in replace_calls] == [template_path, template_path]
+    assert all(src != dst for src, dst in replace_calls)
+
+    # The target holds the new content and no temporary file is left behind
+    with open(template_path, "r") as f:
+        assert f.read() == new_content
+    assert os.listdir(os.path.dirname(template_path)) == ["template.md"]
+
+
+def test_template_write_failure_keeps_original(template_manager, monkeypatch):
+    """Test that a failed write leaves the original template and no temporary file."""
+    template_path = template_manager.create_template("failure_test")
+    with open(template_path, "r") as f:
+        original_content = f.read()
+
+    def failing_replace(src, dst):
+        raise OSError("replace failed")
+
+    monkeypatch.setattr(template_manager_module.os, "replace", failing_replace)
+
+    with pytest.raises(OSError):
+        template_manager.update_template("failure_test", "# Changed\n")
+
+    with open(template_path, "r") as f:
+        assert f.read() == original_content
+    assert os.listdir(os.path.dirname(template_path)) == ["template.md"]
+
+
+@pytest.mark.parametrize("name", ["", "test with spaces", "test/with/slashes", "test!@#$"])
+def test_create_template_invalid_name(template_manager, name):
+    """Test creating a template with an invalid name."""
+    with pytest.raises(ValueError):
+        template_manager.create_template(name)
+
+
+def test_create_template_already_exists(template_manager):
+    """Test creating a template that already exists."""
+    # Create a template
+    template_name = "already_exists"
+    template_manager.create_template(template_name)
+
+    # Try to create it again
+    with pytest.raises(FileExistsError):
+        template_manager.create_template(template_name)
+
+
+def test_update_template(template_manager):
+    """Test updating an existing template."""
+    # Create a template first
+    template_name = "update_test"
+    template_manager.create_template(template_name)
+
+    # New content to update with
+    new_content = """---
 title: {{ title }}
 updated_at: {{ updated_at }}
 type: update_test
@@ -188,82 +208,87 @@ type: update_test
 
 This content has been updated.
 """
-        
-        # Update the template
-        updated_path = self.template_manager.update_template(template_name, new_content)
-        
-        # Check that the path is correct
-        self.assertEqual(os.path.basename(updated_path), "template.md")
-        self.assertEqual(os.path.dirname(updated_path), os.path.join(self.test_dir, template_name))
-        
-        # Check the updated content
-        with open(updated_path, "r") as f:
-            content = f.read()
-            
-        self.assertEqual(content, new_content)
-
-    def test_update_nonexistent_template(self):
-        """Test updating a template that doesn't exist."""
-        with self.assertRaises(FileNotFoundError):
-            self.template_manager.update_template("nonexistent", "Some content")
-
-    def test_delete_template(self):
-        """Test deleting a template."""
-        # Create a template first
-        template_name = "delete_test"
-        template_path = self.template_manager.create_template(template_name)
-        
-        # Verify it exists
-        self.assertTrue(os.path.exists(template_path))
-        
-        # Delete the template
-        result = self.template_manager.delete_template(template_name)
-        
-        # Check the result and that the file is gone
-        self.assertTrue(result)
-        self.assertFalse(os.path.exists(template_path))
-        self.assertFalse(os.path.exists(os.path.dirname(template_path)))  # Directory should be gone too
-        
-        # Should not be in the list anymore
-        templates = self.template_manager.list_templates()
-        self.assertNotIn(template_name, templates)
-
-    def test_delete_builtin_template(self):
-        """Test attempting to delete a built-in template."""
-        # Try to delete the default template
-        with self.assertRaises(ValueError):
-            self.template_manager.delete_template("default")
-            
-        # Default template should still exist
-        self.assertTrue(os.path.exists(os.path.join(self.test_dir, "default", "template.md")))
-        
-        # Should still be in the list
-        templates = self.template_manager.list_templates()
-        self.assertIn("default", templates)
-
-    def test_delete_nonexistent_template(self):
-        """Test deleting a template that doesn't exist."""
-        with self.assertRaises(FileNotFoundError):
-            self.template_manager.delete_template("nonexistent")
-
-    def test_render_template(self):
-        """Test rendering a template with context variables."""
-        # Create a test context
-        context = {
-            "title": "Test Title",
-            "created_at": "2024-05-05T12:00:00",
-            "updated_at": "2024-05-05T12:00:00"
-        }
-        
-        # Render the default template
-        rendered = self.template_manager.render_template("default", context)
-        
-        # Check rendered content
-        self.assertIn("# Test Title", rendered)
-        self.assertIn("created_at: 2024-05-05T12:00:00", rendered)
-        self.assertIn("## Default Template Content", rendered)
-        
-    def test_render_nonexistent_template(self):
-        """Test rendering a template that doesn't exist."""
-        with self.assertRaises(FileNotFoundError):
-            self.template_manager.render_template("nonexistent", {})
\ No newline at end of file
+
+    # Update the template
+    updated_path = template_manager.update_template(template_name, new_content)
+
+    # Check that the path is correct
+    assert updated_path == os.path.join(TEMPLATES_DIR, template_name, "template.md")
+
+    # Check the updated content
+    with open(updated_path, "r") as f:
+        content = f.read()
+
+    assert content == new_content
+
+
+def test_update_nonexistent_template(template_manager):
+    """Test updating a template that doesn't exist."""
+    with pytest.raises(FileNotFoundError):
+        template_manager.update_template("nonexistent", "Some content")
+
+
+def test_delete_template(template_manager):
+    """Test deleting a template."""
+    # Create a template first
+    template_name = "delete_test"
+    template_path = template_manager.create_template(template_name)
+
+    # Verify it exists
+    assert_regular_file(template_path)
+
+    # Delete the template
+    result = template_manager.delete_template(template_name)
+
+    # Check the result and that the file is gone
+    assert result
+    with pytest.raises(FileNotFoundError):
+        os.stat(os.path.dirname(template_path))  # Directory, and so the file, should be gone
+
+    # Should not be in the list anymore
+    templates = template_manager.list_templates()
+    assert template_name not in templates
+
+
+def test_delete_builtin_template(template_manager):
+    """Test attempting to delete a built-in template."""
+    # Try to delete the default template
+    with pytest.raises(ValueError):
+        template_manager.delete_template("default")
+
+    # Default template should still exist
+    assert_regular_file(os.path.join(TEMPLATES_DIR, "default", "template.md"))
+
+    # Should still be in the list
+    templates = template_manager.list_templates()
+    assert "default" in templates
+
+
+def test_delete_nonexistent_template(template_manager):
+    """Test deleting a template that doesn't exist."""
+    with pytest.raises(FileNotFoundError):
+        template_manager.delete_template("nonexistent")
+
+
+def test_render_template(template_manager):
+    """Test rendering a template with context variables."""
+    # Create a test context
+    context = {
+        "title": "Test Title",
+        "created_at": "2024-05-05T12:00:00",
+        "updated_at": "2024-05-05T12:00:00"
+    }
+
+    # Render the default template
+    rendered = template_manager.render_template("default", context)
+
+    # Check rendered content
+    assert "# Test Title" in rendered
+    assert "created_at: 2024-05-05T12:00:00" in rendered
+    assert "## Default Template Content" in rendered
+
+
+def test_render_nonexistent_template(template_manager):
+    """Test rendering a template that doesn't exist."""
+    with pytest.raises(FileNotFoundError):
+        template_manager.render_template("nonexistent", {})
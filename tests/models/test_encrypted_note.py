@@ -3,6 +3,7 @@ Tests for the EncryptedNote model.
 """
 import pytest
 from datetime import datetime
+from types import SimpleNamespace
 from unittest.mock import patch, MagicMock
 
 from app.models.note import Note
@@ -11,8 +12,10 @@ from app.utils.encryption import EncryptionError, DecryptionError, PasswordError
 
 # Sample note data
 SAMPLE_CONTENT = "# Secret Note\n\nThis is a confidential note."
-SAMPLE_TAGS = ["secret", "confidential"]
+SAMPLE_TAGS = ("secret", "confidential")
 SAMPLE_CATEGORY = "Personal"
+SAMPLE_CREATED_ISO = "2024-01-01T10:00:00"
+SAMPLE_UPDATED_ISO = "2024-01-01T11:00:00"
 
 
 @pytest.fixture
@@ -21,9 +24,9 @@ def sample_note():
     return Note(
         title="Secret Note",
         content=SAMPLE_CONTENT,
-        created_at=datetime(2024, 1, 1, 10, 0, 0),
-        updated_at=datetime(2024, 1, 1, 11, 0, 0),
-        tags=SAMPLE_TAGS.copy(),
+        created_at=datetime.fromisoformat(SAMPLE_CREATED_ISO),
+        updated_at=datetime.fromisoformat(SAMPLE_UPDATED_ISO),
+        tags=list(SAMPLE_TAGS),
         category=SAMPLE_CATEGORY,
         metadata={"author": "Test User"},
         filename="secret-note.md",
@@ -33,6 +36,20 @@ def sample_note():
 
 class TestEncryptedNote:
     """Tests for the EncryptedNote class."""
+
+    @pytest.fixture(autouse=True)
+    def enc_mocks(self, monkeypatch):
+        """
+        Replace encryption with cheap reversible stand-ins.
+
+        Tests can set return_value or side_effect on the returned mocks,
+        or inspect their calls.
+        """
+        enc = MagicMock(wraps=lambda content, password, metadata=None: f"ENC:{content}")
+        dec = MagicMock(wraps=lambda content, password: (content[4:], {}))
+        monkeypatch.setattr("app.models.encrypted_note.encrypt_content", enc)
+        monkeypatch.setattr("app.models.encrypted_note.decrypt_content", dec)
+        return SimpleNamespace(enc=enc, dec=dec)
     
     def test_create_from_note(self, sample_note):
         """Test creating an EncryptedNote from a regular Note."""
@@ -57,18 +74,17 @@ class TestEncryptedNote:
         # Content should be different (encrypted)
         assert encrypted_note.content != sample_note.content
     
-    @patch("app.models.encrypted_note.encrypt_content")
-    def test_encrypt(self, mock_encrypt, sample_note):
+    def test_encrypt(self, enc_mocks, sample_note):
         """Test encrypting a note."""
         # Mock encrypt_content to return a known value
-        mock_encrypt.return_value = "ENCRYPTED_CONTENT"
+        enc_mocks.enc.return_value = "ENCRYPTED_CONTENT"
         
         # Encrypt the note
         encrypted_note = EncryptedNote.encrypt(sample_note, "password")
         
         # Check that encrypt_content was called with correct parameters
-        mock_encrypt.assert_called_once()
-        args, kwargs = mock_encrypt.call_args
+        enc_mocks.enc.assert_called_once()
+        args, kwargs = enc_mocks.enc.call_args
         
         # First arg should be the content
         assert args[0] == sample_note.content
@@ -81,22 +97,21 @@ class TestEncryptedNote:
         assert encrypted_note.is_encrypted is True
         assert encrypted_note.encrypted_at is not None
     
-    @patch("app.models.encrypted_note.decrypt_content")
-    def test_decrypt(self, mock_decrypt, sample_note):
+    def test_decrypt(self, enc_mocks, sample_note):
         """Test decrypting an encrypted note."""
         # Create an encrypted note first
         encrypted_note = EncryptedNote.from_note(sample_note)
         encrypted_note.content = "ENCRYPTED_CONTENT"  # Mock encrypted content
         
         # Mock decrypt_content to return the original content and metadata
-        mock_decrypt.return_value = (
+        enc_mocks.dec.return_value = (
             SAMPLE_CONTENT, 
             {
                 "title": sample_note.title,
                 "tags": sample_note.tags,
                 "category": sample_note.category,
-                "created_at": sample_note.created_at.isoformat(),
-                "updated_at": sample_note.updated_at.isoformat(),
+                "created_at": SAMPLE_CREATED_ISO,
+                "updated_at": SAMPLE_UPDATED_ISO,
                 "author": "Test User"
             }
         )
@@ -105,7 +120,7 @@ class TestEncryptedNote:
         decrypted_note, metadata = encrypted_note.decrypt("password")
         
         # Check that decrypt_content was called with correct parameters
-        mock_decrypt.assert_called_once_with("ENCRYPTED_CONTENT", "password")
+        enc_mocks.dec.assert_called_once_with("ENCRYPTED_CONTENT", "password")
         
         # Check that the decrypted note has the original content
         assert decrypted_note.content == SAMPLE_CONTENT
@@ -129,9 +144,7 @@ class TestEncryptedNote:
         with pytest.raises(DecryptionError):
             encrypted_note.decrypt("password")
     
-    @patch("app.models.encrypted_note.decrypt_content")
-    @patch("app.models.encrypted_note.encrypt_content")
-    def test_change_password(self, mock_encrypt, mock_decrypt, sample_note):
+    def test_change_password(self, enc_mocks, sample_note):
         """Test changing the password of an encrypted note."""
         # Create an encrypted note
         encrypted_note = EncryptedNote.from_note(sample_note)
@@ -139,10 +152,10 @@ class TestEncryptedNote:
         encrypted_note.is_encrypted = True
         
         # Mock decrypt_content to simulate successful decryption
-        mock_decrypt.return_value = (SAMPLE_CONTENT, {"title": sample_note.title})
+        enc_mocks.dec.return_value = (SAMPLE_CONTENT, {"title": sample_note.title})
         
         # Mock encrypt_content to simulate re-encryption with the new password
-        mock_encrypt.return_value = "NEW_ENCRYPTED_CONTENT"
+        enc_mocks.enc.return_value = "NEW_ENCRYPTED_CONTENT"
         
         # Change the password
         encrypted_note.change_password("old-password", "new-password")
@@ -151,8 +164,8 @@ class TestEncryptedNote:
         assert encrypted_note.content == "NEW_ENCRYPTED_CONTENT"
         
         # Check that the appropriate functions were called
-        mock_decrypt.assert_called_once_with("OLD_ENCRYPTED_CONTENT", "old-password")
-        mock_encrypt.assert_called_once()
+        enc_mocks.dec.assert_called_once_with("OLD_ENCRYPTED_CONTENT", "old-password")
+        enc_mocks.enc.assert_called_once()
     
     def test_change_password_not_encrypted(self, sample_note):
         """Test changing password of a note that's not encrypted."""
@@ -164,8 +177,7 @@ class TestEncryptedNote:
         with pytest.raises(DecryptionError):
             encrypted_note.change_password("old-password", "new-password")
     
-    @patch("app.models.encrypted_note.decrypt_content")
-    def test_change_password_wrong_password(self, mock_decrypt, sample_note):
+    def test_change_password_wrong_password(self, enc_mocks, sample_note):
         """Test changing password with incorrect current password."""
         # Create an encrypted note
         encrypted_note = EncryptedNote.from_note(sample_note)
@@ -173,7 +185,7 @@ class TestEncryptedNote:
         encrypted_note.is_encrypted = True
         
         # Mock decrypt_content to simulate password failure
-        mock_decrypt.side_effect = PasswordError("Invalid password")
+        enc_mocks.dec.side_effect = PasswordError("Invalid password")
         
         # Attempt to change password
         with pytest.raises(PasswordError):
@@ -202,7 +214,7 @@ class TestEncryptedNote:
         # Create encrypted note with known values
         encrypted_note = EncryptedNote.from_note(sample_note)
         encrypted_note.is_encrypted = True
-        encrypted_note.encrypted_at = datetime(2024, 1, 15)
+        encrypted_note.encrypted_at = datetime.fromisoformat("2024-01-15T00:00:00")
         
         # Convert to dictionary
         note_dict = encrypted_note.to_dict()
@@ -221,13 +233,12 @@ class TestEncryptedNote:
         assert "is_encrypted" in note_dict
         assert note_dict["is_encrypted"] is True
         assert "encrypted_at" in note_dict
-        assert note_dict["encrypted_at"] == encrypted_note.encrypted_at.isoformat()
+        assert note_dict["encrypted_at"] == "2024-01-15T00:00:00"
     
-    @patch("app.models.encrypted_note.encrypt_content")
-    def test_encrypt_error_handling(self, mock_encrypt, sample_note):
+    def test_encrypt_error_handling(self, enc_mocks, sample_note):
         """Test error handling during encryption."""
         # Mock encrypt_content to raise an exception
-        mock_encrypt.side_effect = EncryptionError("Test error")
+        enc_mocks.enc.side_effect = EncryptionError("Test error")
         
         # This should propagate the error
         with pytest.raises(EncryptionError):
@@ -1,8 +1,9 @@
 """
 Tests for the Note model.
 """
+import itertools
 import pytest
-from datetime import datetime
+from datetime import datetime, timedelta
 from app.models.note import Note
 
 def test_note_initialization():
@@ -68,15 +69,23 @@ def test_remove_tag():
     note.remove_tag("nonexistent")
     assert note.tags == ["example"]
 
-def test_update_content():
+def test_update_content(monkeypatch):
     """Test updating the content of a note."""
-    note = Note(title="Test", content="Original content")
+    start = datetime(2025, 1, 1, 12, 0, 0)
+    ticks = itertools.count(1)
+
+    class FakeDatetime(datetime):
+        """datetime whose now() advances one second per call."""
+
+        @classmethod
+        def now(cls, tz=None):
+            return start + timedelta(seconds=next(ticks))
+
+    # Use a fake clock so the timestamp changes without waiting
+    monkeypatch.setattr("app.models.note.datetime", FakeDatetime)
+    note = Note(title="Test", content="Original content", created_at=start, updated_at=start)
     original_updated_at = note.updated_at
     
-    # Wait a moment to ensure the timestamp will be different
-    import time
-    time.sleep(0.001)
-    
     note.update_content("New content")
     assert note.content == "New content"
     assert note.updated_at > original_updated_at
@@ -105,5 +114,5 @@ def test_to_dict():
     assert note_dict["content"] == content
     assert note_dict["tags"] == tags
     assert note_dict["category"] == category
-    assert note_dict["created_at"] == created_at.isoformat()
-    assert note_dict["updated_at"] == updated_at.isoformat()
\ No newline at end of file
+    assert note_dict["created_at"] == "2025-01-01T12:00:00"
+    assert note_dict["updated_at"] == "2025-01-01T12:30:00"
\ No newline at end of file
@@ -2,6 +2,7 @@
 Tests for the encryption utility functionality.
 """
 import os
+import textwrap
 import pytest
 import base64
 from unittest.mock import patch, MagicMock, mock_open
@@ -9,6 +10,8 @@ from unittest.mock import patch, MagicMock, mock_open
 from app.utils.encryption import (
     encrypt_content, 
     decrypt_content, 
+    encrypt_bytes,
+    decrypt_bytes,
     is_encrypted, 
     change_password,
     derive_key,
@@ -16,7 +19,9 @@ from app.utils.encryption import (
     DecryptionError,
     AuthenticationError,
     PasswordError,
-    MARKER
+    ITERATIONS,
+    MARKER,
+    MARKER_B64_LENGTH
 )
 
 # Sample content for tests
@@ -44,6 +49,30 @@ SAMPLE_METADATA = {
 }
 
 
+@pytest.fixture(scope="module", autouse=True)
+def fast_kdf():
+    """Lower the PBKDF2 iteration count for this module's tests."""
+    # Module scoped so that it also covers encrypted_sample
+    patcher = pytest.MonkeyPatch()
+    patcher.setattr("app.utils.encryption.ITERATIONS", 1000)
+    yield
+    patcher.undo()
+
+
+@pytest.fixture(scope="module")
+def encrypted_sample():
+    """Encrypt SAMPLE_CONTENT once for the tests that only need valid ciphertext."""
+    return encrypt_content(SAMPLE_CONTENT, "test-password")
+
+
+@pytest.fixture(params=["base64", "pybase64"])
+def b64_backend(request, monkeypatch):
+    """Run a test once with each base64 backend the encryption module may use."""
+    module = pytest.importorskip(request.param)
+    monkeypatch.setattr("app.utils.encryption._b64", module)
+    return module
+
+
 class TestEncryption:
     """Tests for the encryption utility functions."""
     
@@ -94,6 +123,22 @@ class TestEncryption:
         # Verify content matches
         assert decrypted == SAMPLE_CONTENT
     
+    def test_encrypt_decrypt_bytes_roundtrip(self):
+        """Test the raw bytes variants and that they match the base64 format."""
+        encrypted = encrypt_bytes(SAMPLE_CONTENT, "test-password", SAMPLE_METADATA)
+        
+        # Raw output starts with the marker and is not base64 encoded
+        assert isinstance(encrypted, bytes)
+        assert encrypted.startswith(MARKER)
+        
+        decrypted, metadata = decrypt_bytes(encrypted, "test-password")
+        assert decrypted == SAMPLE_CONTENT
+        assert metadata["title"] == SAMPLE_METADATA["title"]
+        
+        # The base64 form decrypts with decrypt_content
+        decrypted, _ = decrypt_content(base64.b64encode(encrypted).decode('utf-8'), "test-password")
+        assert decrypted == SAMPLE_CONTENT
+    
     def test_encrypt_with_empty_content(self):
         """Test encryption with empty content."""
         encrypted = encrypt_content("", "test-password")
@@ -120,27 +165,42 @@ class TestEncryption:
         with pytest.raises(Exception):
             encrypt_content(SAMPLE_CONTENT, "")
     
-    def test_decrypt_wrong_password(self):
+    def test_decrypt_wrong_password(self, encrypted_sample):
         """Test decryption with an incorrect password."""
-        # Encrypt with one password
-        encrypted = encrypt_content(SAMPLE_CONTENT, "test-password")
-        
         # Try to decrypt with a different password
         with pytest.raises(PasswordError):
-            decrypt_content(encrypted, "wrong-password")
+            decrypt_content(encrypted_sample, "wrong-password")
     
-    def test_decrypt_corrupted_data(self):
+    def test_decrypt_corrupted_data(self, encrypted_sample):
         """Test decryption with corrupted data."""
-        # Create some encrypted content
-        encrypted = encrypt_content(SAMPLE_CONTENT, "test-password")
-        
-        # Corrupt it by adding some characters
-        corrupted = encrypted + "abc"
+        # Corrupt the encrypted content by adding some characters
+        corrupted = encrypted_sample + "abc"
         
         # Try to decrypt
         with pytest.raises((DecryptionError, ValueError)):
             decrypt_content(corrupted, "test-password")
     
+    def test_malformed_base64_same_on_both_backends(self, b64_backend, encrypted_sample):
+        """Test that malformed base64 is handled the same with either backend."""
+        # Data after the ciphertext is rejected rather than silently dropped
+        with pytest.raises(DecryptionError):
+            decrypt_content(encrypted_sample + "abc", "test-password")
+        with pytest.raises(DecryptionError):
+            decrypt_content("This is not encrypted", "test-password")
+        
+        # Surrounding whitespace and line wrapping are ignored
+        decrypted, _ = decrypt_content("\n" + encrypted_sample + "\n", "test-password")
+        assert decrypted == SAMPLE_CONTENT
+        for width in (76, 10):
+            wrapped = "\n".join(textwrap.wrap(encrypted_sample, width))
+            decrypted, _ = decrypt_content(wrapped, "test-password")
+            assert decrypted == SAMPLE_CONTENT
+            assert is_encrypted(wrapped) is True
+        
+        assert is_encrypted(encrypted_sample) is True
+        assert is_encrypted("This is not encrypted") is False
+        assert is_encrypted("!!!!" + encrypted_sample) is False
+    
     def test_decrypt_invalid_format(self):
         """Test decryption with data in totally wrong format."""
         # Try to decrypt something that isn't encrypted
@@ -165,13 +225,20 @@ class TestEncryption:
         with pytest.raises(PasswordError):
             decrypt_content(new_encrypted, "old-password")
     
-    def test_is_encrypted(self):
+    def test_is_encrypted(self, encrypted_sample):
         """Test detection of encrypted content."""
-        # Create encrypted content
-        encrypted = encrypt_content(SAMPLE_CONTENT, "test-password")
+        # Check that encrypted content is detected as encrypted
+        assert is_encrypted(encrypted_sample) is True
         
-        # Check that it's detected as encrypted
-        assert is_encrypted(encrypted) is True
+        # Leading whitespace, as left by notes without frontmatter, is skipped
+        assert is_encrypted("\n" + encrypted_sample) is True
+        assert is_encrypted(" " + encrypted_sample) is True
+        
+        # Only the marker prefix is checked; a corrupted tail fails on decryption
+        corrupted = encrypted_sample[:MARKER_B64_LENGTH] + "!" * 10
+        assert is_encrypted(corrupted) is True
+        with pytest.raises(DecryptionError):
+            decrypt_content(corrupted, "test-password")
         
         # Check that regular content is not detected as encrypted
         assert is_encrypted("This is not encrypted") is False
@@ -198,6 +265,21 @@ class TestEncryption:
         key4 = derive_key("test-password", salt2)
         assert key1 != key4
     
+    @pytest.mark.parametrize("backend", ["hashlib", "fastpbkdf2"])
+    def test_derive_key_known_answer(self, monkeypatch, backend):
+        """Test that each PBKDF2 backend derives the same key as the original PBKDF2HMAC code."""
+        module = pytest.importorskip(backend)
+        monkeypatch.setattr("app.utils.encryption.pbkdf2_hmac", module.pbkdf2_hmac)
+        
+        # Expected value from cryptography's PBKDF2HMAC with SHA-256 and a 32 byte key
+        key = derive_key("test-password", b"1234567890123456", 1000)
+        assert key.hex() == "bb9a6fcceb0e33c6e132d71394d5c3c804361de3041ed20052a2b3b721170991"
+    
+    def test_kdf_cost_is_production_grade(self):
+        """Test that the shipped PBKDF2 iteration count is not lowered."""
+        # ITERATIONS was imported before fast_kdf patched the module
+        assert ITERATIONS >= 100000
+    
     def test_encryption_error(self, monkeypatch):
         """Test handling of encryption errors."""
         # Mock the AESGCM class to raise an exception
@@ -209,16 +291,13 @@ class TestEncryption:
         with pytest.raises(EncryptionError):
             encrypt_content(SAMPLE_CONTENT, "test-password")
     
-    def test_decryption_error(self, monkeypatch):
+    def test_decryption_error(self, monkeypatch, encrypted_sample):
         """Test handling of decryption errors."""
-        # First create valid encrypted content
-        encrypted = encrypt_content(SAMPLE_CONTENT, "test-password")
-        
-        # Then mock the AESGCM class to raise an exception
+        # Mock the AESGCM class to raise an exception
         mock_aesgcm = MagicMock()
         mock_aesgcm.return_value.decrypt.side_effect = Exception("Decryption failed")
         monkeypatch.setattr("app.utils.encryption.AESGCM", mock_aesgcm)
         
         # Attempt to decrypt
         with pytest.raises(DecryptionError):
-            decrypt_content(encrypted, "test-password")
\ No newline at end of file
+            decrypt_content(encrypted_sample, "test-password")
\ No newline at end of file